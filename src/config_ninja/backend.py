@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import functools
 import json
 import logging
 import typing
@@ -11,7 +13,16 @@ from typing import Any, AsyncIterator, Callable, Dict
 import tomlkit as toml
 import yaml
 
-__all__ = ['FormatT', 'dumps', 'loads', 'Backend']
+try:
+    from yaml import CDumper as YAMLDumper
+    from yaml import CSafeDumper as YAMLSafeDumper
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # pragma: no cover  # PyYAML was built without libyaml
+    from yaml import Dumper as YAMLDumper  # type: ignore[assignment]
+    from yaml import SafeDumper as YAMLSafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
+
+__all__ = ['FormatT', 'dumps', 'loads', 'to_thread', 'Backend']
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +32,7 @@ FormatT = typing.Literal['json', 'raw', 'toml', 'yaml', 'yml']
 # note: `3.8` was not respecting `from __future__ import annotations` for delayed evaluation
 LoadT = Callable[[str], Dict[str, Any]]
 DumpT = Callable[[Dict[str, Any]], str]
+T = typing.TypeVar('T')
 
 
 def load_raw(raw: str) -> dict[str, str]:
@@ -33,20 +45,36 @@ def dump_raw(data: dict[str, str]) -> str:
     return data['content']
 
 
+def load_yaml(raw: str) -> dict[str, Any]:
+    """Safely parse the YAML string, using `libyaml` when it is available."""
+    return yaml.load(raw, Loader=YAMLLoader)  # type: ignore[no-any-return]
+
+
+def dump_yaml(data: dict[str, Any]) -> str:
+    """Serialize the given `dict` to YAML, using `libyaml` when it is available."""
+    return yaml.dump(data, Dumper=YAMLDumper)
+
+
+def safe_dump_yaml(data: Any) -> str:
+    """Serialize `data` to YAML using only standard tags (like `yaml.safe_dump()`), with `libyaml` if available."""
+    return yaml.dump(data, Dumper=YAMLSafeDumper)
+
+
 LOADERS: dict[FormatT, LoadT] = {
     'json': json.loads,
     'raw': load_raw,
     'toml': toml.loads,
-    'yaml': yaml.safe_load,
-    'yml': yaml.safe_load,
+    'yaml': load_yaml,
+    'yml': load_yaml,
 }
+"""Deserialize each `FormatT` (YAML is parsed with `libyaml` when it is available)."""
 
 DUMPERS: dict[FormatT, DumpT] = {
     'json': json.dumps,
     'raw': dump_raw,
     'toml': toml.dumps,  # pyright: ignore[reportUnknownMemberType]
-    'yaml': yaml.dump,
-    'yml': yaml.dump,
+    'yaml': dump_yaml,
+    'yml': dump_yaml,
 }
 
 
@@ -61,13 +89,31 @@ def dumps(fmt: FormatT, data: dict[str, Any]) -> str:
 
 
 def loads(fmt: FormatT, raw: str) -> dict[str, Any]:
-    """Deserialize the given `raw` string for the given `FormatT`."""
+    """Deserialize the given `raw` string for the given `FormatT`.
+
+    JSON is parsed with the standard library, so integers keep their full precision:
+
+    >>> loads('json', '{"a": 18446744073709551616}')
+    {'a': 18446744073709551616}
+    """
     try:
         return LOADERS[fmt](raw)
     except KeyError as exc:  # pragma: no cover
         raise ValueError(f"unsupported format: '{fmt}'") from exc
 
 
+async def to_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run the blocking `func` in the default executor so the event loop is free to run other tasks.
+
+    This is equivalent to `asyncio.to_thread()`, which is unavailable on Python 3.8:
+
+    >>> asyncio.run(to_thread(sum, [1, 2, 3]))
+    6
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
 class Backend(abc.ABC):
     """Define the API for backend implementations."""
 
@@ -16,15 +16,14 @@ import sys
 import typing
 from pathlib import Path
 
-import pyspry
 import rich
 import typer
-import yaml
 from rich.logging import RichHandler
 from rich.markdown import Markdown
 
 import config_ninja
 from config_ninja import controller, systemd
+from config_ninja.backend import safe_dump_yaml, to_thread
 from config_ninja.controller import SYSTEMD_AVAILABLE
 
 try:
@@ -149,10 +148,11 @@ def load_config(ctx: typer.Context, value: typing.Optional[Path]) -> None:
             else '',
             extra={'markup': True},
         )
-        ctx.obj['settings'] = None
+        ctx.obj['settings'] = ctx.obj['objects'] = None
 
     else:
-        ctx.obj['settings'] = config_ninja.load_settings(settings_file)
+        ctx.obj['settings'] = settings = config_ninja.load_settings(settings_file)
+        ctx.obj['objects'] = settings.OBJECTS
 
 
 ConfigAnnotation: TypeAlias = Annotated[
@@ -341,14 +341,23 @@ def handle_key_errors(objects: typing.Dict[str, typing.Any]) -> typing.Iterator[
         yield
     except KeyError as exc:  # pragma: no cover
         rich.print(f'[red]ERROR[/]: Missing key: [green]{exc.args[0]}[/]\n')
-        rich.print(yaml.dump(objects))
+        rich.print(safe_dump_yaml(objects))
         raise typer.Exit(1) from exc
 
 
+async def make_parent_dirs(controllers: typing.List[controller.BackendController]) -> None:
+    """Create each distinct destination directory (concurrently, in worker threads)."""
+    parents = {ctrl.dest.path.parent for ctrl in controllers}
+    await asyncio.gather(*[to_thread(parent.mkdir, parents=True, exist_ok=True) for parent in parents])
+
+
 async def poll_all(
     controllers: typing.List[controller.BackendController], get_or_write: typing.Literal['get', 'write']
 ) -> None:
     """Run the given controllers within an `asyncio` event loop to monitor and apply changes."""
+    if get_or_write == 'write':
+        await make_parent_dirs(controllers)
+
     await asyncio.gather(*[ctrl.aget(rich.print) if get_or_write == 'get' else ctrl.awrite() for ctrl in controllers])
 
 
@@ -359,10 +368,8 @@ def _check_systemd() -> None:
         raise typer.Exit(1)
 
 
-def _new_controller(settings: pyspry.Settings, key: str) -> controller.BackendController:
-    ctrl = controller.BackendController(settings, key, handle_key_errors)
-    ctrl.dest.path.parent.mkdir(parents=True, exist_ok=True)
-    return ctrl
+def _new_controller(objects: typing.Dict[str, typing.Any], key: str) -> controller.BackendController:
+    return controller.BackendController(objects, key, handle_key_errors)
 
 
 # ⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯⎯
@@ -380,9 +387,9 @@ def get(
     version: VersionAnnotation = None,
 ) -> None:
     """Print the value of the specified configuration object."""
-    settings: pyspry.Settings = ctx.obj['settings']
+    objects: typing.Dict[str, typing.Any] = ctx.obj['objects']
 
-    controllers = [_new_controller(settings, key) for key in keys or settings.OBJECTS]
+    controllers = [_new_controller(objects, key) for key in keys or objects]
 
     if poll:
         logger.debug(
@@ -409,15 +416,16 @@ def apply(
     version: VersionAnnotation = None,
 ) -> None:
     """Apply the specified configuration to the system."""
-    settings: pyspry.Settings = ctx.obj['settings']
+    objects: typing.Dict[str, typing.Any] = ctx.obj['objects']
 
-    controllers = [_new_controller(settings, key) for key in keys or settings.OBJECTS]
+    controllers = [_new_controller(objects, key) for key in keys or objects]
 
     if poll:
         rich.print('Begin monitoring: ' + ', '.join(f'[yellow]{ctrl.key}[/yellow]' for ctrl in controllers))
         asyncio.run(poll_all(controllers, 'write'))
         return
 
+    asyncio.run(make_parent_dirs(controllers))
     for ctrl in controllers:
         rich.print(f'Apply [yellow]{ctrl.key}[/yellow]: {ctrl}')
         ctrl.write()
@@ -430,10 +438,8 @@ def apply(
 )
 def monitor(ctx: typer.Context) -> None:
     """Apply all configuration objects to the filesystem, and poll for changes."""
-    settings: pyspry.Settings = ctx.obj['settings']
-    controllers = [controller.BackendController(settings, key, handle_key_errors) for key in settings.OBJECTS]
-    for ctrl in controllers:
-        ctrl.dest.path.parent.mkdir(parents=True, exist_ok=True)
+    objects: typing.Dict[str, typing.Any] = ctx.obj['objects']
+    controllers = [_new_controller(objects, key) for key in objects]
 
     rich.print('Begin monitoring: ' + ', '.join(f'[yellow]{ctrl.key}[/yellow]' for ctrl in controllers))
     asyncio.run(poll_all(controllers, 'write'))
@@ -448,9 +454,14 @@ def self_print(
     version: VersionAnnotation = None,
 ) -> None:
     """Print [bold blue]config-ninja[/]'s settings."""
-    if not (settings := ctx.obj.get('settings')):
+    if not (objects := ctx.obj.get('objects')):
         raise typer.Exit(1)
-    rich.print(yaml.dump(settings.OBJECTS))
+
+    dumped = safe_dump_yaml(objects)
+    if sys.stdout.isatty():
+        rich.print(dumped)
+    else:  # skip `rich` markup processing when the output is piped to another program
+        sys.stdout.write(dumped)
 
 
 @self_app.command()
@@ -16,13 +16,14 @@ through AWS AppConfig:
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
 import logging
+import random
 import warnings
 from typing import TYPE_CHECKING, Any, AsyncIterator, Literal
 
-import boto3
-
-from config_ninja.backend import Backend
+from config_ninja.backend import Backend, to_thread
 
 try:  # pragma: no cover
     from typing import TypeAlias  # type: ignore[attr-defined,unused-ignore]
@@ -31,7 +32,8 @@ except ImportError:  # pragma: no cover
 
 
 if TYPE_CHECKING:  # pragma: no cover
-    from botocore.paginate import PageIterator
+    import boto3
+    from botocore.paginate import PageIterator, Paginator
     from mypy_boto3_appconfig.client import AppConfigClient
     from mypy_boto3_appconfigdata import AppConfigDataClient
 
@@ -45,6 +47,38 @@ OperationName: TypeAlias = Literal['list_applications', 'list_configuration_prof
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _session() -> boto3.Session:
+    """Create the default `boto3.Session` once, so credentials and region are only resolved once."""
+    import boto3  # pylint: disable=import-outside-toplevel  # defer the import cost until needed
+
+    return boto3.Session()
+
+
+@functools.lru_cache(maxsize=None)
+def _appconfig_client(session: boto3.Session) -> AppConfigClient:
+    """Create (once per session) the `boto3` client for the AWS AppConfig service."""
+    return session.client('appconfig')  # pyright: ignore[reportUnknownMemberType]
+
+
+@functools.lru_cache(maxsize=None)
+def _appconfigdata_client(session: boto3.Session) -> AppConfigDataClient:
+    """Create (once per session) the `boto3` client for the AWS AppConfig Data service.
+
+    Backends created from the same session share this client.
+    """
+    return session.client('appconfigdata')  # pyright: ignore[reportUnknownMemberType]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_paginator(client: AppConfigClient, operation_name: OperationName) -> Paginator[Any]:
+    """Create (once per client) the paginator for the given operation.
+
+    `botocore` builds a new paginator class on every `get_paginator()` call, so reuse them.
+    """
+    return client.get_paginator(operation_name)
+
+
 class AppConfigBackend(Backend):
     """Retrieve the deployed configuration from AWS AppConfig.
 
@@ -109,17 +143,21 @@ class AppConfigBackend(Backend):
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _get_id_from_name(name: str, operation_name: OperationName, client: AppConfigClient, **kwargs: Any) -> str:
-        page_iterator: PageIterator = client.get_paginator(operation_name).paginate(**kwargs)
-        ids: list[str] = list(page_iterator.search(f'Items[?Name == `{name}`].Id'))
+        """Look up the ID of the named resource; results are cached for the life of the process."""
+        page_iterator: PageIterator[Any] = _get_paginator(client, operation_name).paginate(**kwargs)
+
+        # pages are fetched lazily; stop as soon as a second match proves the name is ambiguous
+        ids: list[str] = list(itertools.islice(page_iterator.search(f'Items[?Name == `{name}`].Id'), 2))
 
         if not ids:
             raise ValueError(f'no "{operation_name}" results found for Name="{name}"')
 
         if len(ids) > 1:
             warnings.warn(
-                f"'{operation_name}' found {len(ids)} results for Name='{name}'; "
-                f"'{ids[0]}' will be used and the others ignored: {ids[1:]}",
+                f"'{operation_name}' found multiple results for Name='{name}'; "
+                f"'{ids[0]}' will be used and the others ignored (e.g. '{ids[1]}')",
                 category=RuntimeWarning,
                 stacklevel=3,
             )
@@ -171,7 +209,8 @@ class AppConfigBackend(Backend):
 
         -->
 
-        Use `boto3` to fetch IDs for based on name:
+        Use `boto3` to fetch IDs for based on name (IDs are cached, so backends sharing an
+        application only look it up once):
 
         >>> backend = AppConfigBackend.new('app-name', 'conf-name', 'env-name', session)
         >>> print(f"{backend}")
@@ -205,17 +244,15 @@ class AppConfigBackend(Backend):
             environment_name,
         )
 
-        session = session or boto3.Session()
-        appconfig_client = session.client('appconfig')  # pyright: ignore[reportUnknownMemberType]
+        session = session or _session()
+        appconfig_client = _appconfig_client(session)
         application_id = cls.get_application_id(application_name, appconfig_client)
         configuration_profile_id = cls.get_configuration_profile_id(
             configuration_profile_name, appconfig_client, application_id
         )
         environment_id = cls.get_environment_id(environment_name, appconfig_client, application_id)
 
-        client: AppConfigDataClient = session.client('appconfigdata')  # pyright: ignore[reportUnknownMemberType]
-
-        return cls(client, application_id, configuration_profile_id, environment_id)
+        return cls(_appconfigdata_client(session), application_id, configuration_profile_id, environment_id)
 
     async def poll(self, interval: int = MINIMUM_POLL_INTERVAL_SECONDS) -> AsyncIterator[str]:
         """Poll the AppConfig service for configuration changes.
@@ -244,26 +281,33 @@ class AppConfigBackend(Backend):
         .. note::
             If polling is done too quickly, the AWS AppConfig client will raise a
             `BadRequestException`. This is handled automatically by the backend, which will retry
-            the request after waiting for half the given `interval`.
+            the request after waiting for half the given `interval`. The wait doubles (with a little
+            random jitter) on each consecutive retry, up to four times the `interval`.
         """
-        token = self.client.start_configuration_session(
+        started = await to_thread(
+            self.client.start_configuration_session,
             ApplicationIdentifier=self.application_id,
             EnvironmentIdentifier=self.environment_id,
             ConfigurationProfileIdentifier=self.configuration_profile_id,
             RequiredMinimumPollIntervalInSeconds=interval,
-        )['InitialConfigurationToken']
+        )
+        token = started['InitialConfigurationToken']
+        backoff = interval / 2
 
         while True:
             logger.debug('Poll for configuration changes')
             try:
-                resp = self.client.get_latest_configuration(ConfigurationToken=token)
+                resp = await to_thread(self.client.get_latest_configuration, ConfigurationToken=token)
             except self.client.exceptions.BadRequestException as exc:
                 if exc.response['Error']['Message'] != 'Request too early':  # pragma: no cover
                     raise
-                logger.debug('Request too early; retrying in %d seconds', interval / 2)
-                await asyncio.sleep(interval / 2)
+                delay = backoff + random.uniform(0, backoff * 0.1)  # noqa: S311  # not for cryptography
+                logger.debug('Request too early; retrying in %.1f seconds', delay)
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, interval * 4)
                 continue
 
+            backoff = interval / 2
             token = resp['NextPollConfigurationToken']
             if content := resp['Configuration'].read():
                 yield content.decode()
@@ -3,18 +3,20 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
+import hashlib
 import logging
 import typing
 from pathlib import Path
 
-import jinja2
 import pyspry
 
 from config_ninja import systemd
-from config_ninja.backend import DUMPERS, Backend, FormatT, dumps, loads
+from config_ninja.backend import DUMPERS, Backend, FormatT, loads
 from config_ninja.contrib import get_backend
 
 if typing.TYPE_CHECKING:  # pragma: no cover
+    import jinja2
     import sh
 
     try:
@@ -40,6 +42,21 @@ ActionType: TypeAlias = typing.Callable[[str], typing.Any]
 ErrorHandler: TypeAlias = typing.Callable[[typing.Dict[typing.Any, typing.Any]], typing.ContextManager[None]]
 
 
+@functools.lru_cache(maxsize=None)
+def _get_env(parent: Path) -> jinja2.Environment:
+    """Create (once per directory) the `jinja2.Environment` for loading templates from `parent`.
+
+    Reusing the environment also reuses its cache of compiled templates:
+
+    >>> _get_env(Path('templates')) is _get_env(Path('templates'))
+    True
+    """
+    import jinja2  # pylint: disable=import-outside-toplevel  # defer the import cost until needed
+
+    loader = jinja2.FileSystemLoader(parent)
+    return jinja2.Environment(autoescape=jinja2.select_autoescape(default=True), loader=loader)
+
+
 @dataclasses.dataclass
 class DestSpec:
     """Container for the destination spec parsed from `config-ninja`_'s own configuration file.
@@ -59,13 +76,25 @@ class DestSpec:
     - if `jinja2.environment.Template`, this template will be used to render the configuration file
     """
 
+    render: typing.Callable[[dict[str, typing.Any]], str] = dataclasses.field(init=False, repr=False, compare=False)
+    """Render the configuration data to a string (bound once, based on the type of `format`)."""
+
+    def __post_init__(self) -> None:
+        """Bind `render` to the template or dumper for `format`."""
+        if isinstance(self.format, str):
+            try:
+                self.render = DUMPERS[self.format]
+            except KeyError as exc:  # pragma: no cover
+                raise ValueError(f"unsupported format: '{self.format}'") from exc
+        else:
+            self.render = self.format.render
+
     def __str__(self) -> str:
         """Represent the destination spec as a string."""
-        if self.is_template:
-            assert isinstance(self.format, jinja2.Template)  # noqa: S101  # 👈 for static analysis
-            fmt = f'(template: {self.format.name})'
-        else:
+        if isinstance(self.format, str):
             fmt = f'(format: {self.format})'
+        else:
+            fmt = f'(template: {self.format.name})'
 
         return f'{fmt} -> {self.path}'
 
@@ -78,16 +107,14 @@ class DestSpec:
             return DestSpec(format=fmt, path=path)
 
         template_path = Path(data['format'])
-
-        loader = jinja2.FileSystemLoader(template_path.parent)
-        env = jinja2.Environment(autoescape=jinja2.select_autoescape(default=True), loader=loader)
+        env = _get_env(template_path.parent)
 
         return DestSpec(path=path, format=env.get_template(template_path.name))
 
     @property
     def is_template(self) -> bool:
         """Whether the destination uses a Jinja2 template."""
-        return isinstance(self.format, jinja2.Template)
+        return not isinstance(self.format, str)
 
 
 class BackendController:
@@ -105,8 +132,8 @@ class BackendController:
     key: str
     """The key of the backend in the settings file"""
 
-    settings: pyspry.Settings
-    """`config-ninja`_'s own configuration settings
+    objects: dict[str, pyspry.ConfigNinjaObject]
+    """The configuration objects from `config-ninja`_'s own settings file (`pyspry.Settings.OBJECTS`)
 
     .. _config-ninja: https://bryant-finney.github.io/config-ninja/config_ninja.html
     """
@@ -118,51 +145,73 @@ class BackendController:
     object from the backend.
     """
 
-    def __init__(self, settings: pyspry.Settings, key: str, handle_key_errors: ErrorHandler) -> None:
-        """Parse the settings to initialize the backend."""
-        self.settings, self.key = settings, key
+    _last_digest: bytes | None = None
+    """Hash of the content most recently written to `dest`; used to skip redundant writes."""
+
+    _passthrough: bool = False
+    """Whether the backend's content is copied to `dest` as-is (both formats are `'raw'`)."""
+
+    def __init__(self, objects: dict[str, pyspry.ConfigNinjaObject], key: str, handle_key_errors: ErrorHandler) -> None:
+        """Parse the settings to initialize the backend.
+
+        The `objects` mapping is read from the settings once by the caller and shared by all of its
+        controllers, avoiding a `pyspry.Settings` attribute lookup for each controller.
+        """
+        self.objects, self.key = objects, key
 
         self.handle_key_errors = handle_key_errors
-        self.src_format, self.backend = self._init_backend()
-        self.dest = self._get_dest()
+        with handle_key_errors(objects):
+            self.src_format, self.backend = self._init_backend()
+            self.dest = self._get_dest()
+
+        self._passthrough = self.src_format == 'raw' and self.dest.format == 'raw'
 
     def __str__(self) -> str:
         """Represent the controller as its backend populating its destination."""
         return f'{self.backend} ({self.src_format}) -> {self.dest}'
 
     def _get_dest(self) -> DestSpec:
-        """Read the destination spec from the settings file."""
-        objects = self.settings.OBJECTS
-        with self.handle_key_errors(objects):
-            return DestSpec.from_primitives(objects[self.key]['dest'])
+        """Read the destination spec from the settings file.
+
+        .. note:: `KeyError` exceptions are reported by `handle_key_errors`, which `__init__` enters once.
+        """
+        return DestSpec.from_primitives(self.objects[self.key]['dest'])
 
     def _init_backend(self) -> tuple[FormatT, Backend]:
-        """Get the backend for the specified configuration object."""
-        objects = self.settings.OBJECTS
-
-        with self.handle_key_errors(objects):
-            source = objects[self.key]['source']
-            backend_class: type[Backend] = get_backend(source['backend'])
-            fmt = source.get('format', 'raw')
-            if source.get('new'):
-                backend = backend_class.new(**source['new']['kwargs'])
-            else:
-                backend = backend_class(**source['init']['kwargs'])
+        """Get the backend for the specified configuration object.
+
+        .. note:: `KeyError` exceptions are reported by `handle_key_errors`, which `__init__` enters once.
+        """
+        source = self.objects[self.key]['source']
+        backend_class: type[Backend] = get_backend(source['backend'])
+        fmt = source.get('format', 'raw')
+        if source.get('new'):
+            backend = backend_class.new(**source['new']['kwargs'])
+        else:
+            backend = backend_class(**source['init']['kwargs'])
 
         return fmt, backend
 
-    def _do(self, action: ActionType, data: dict[str, typing.Any]) -> None:
-        if self.dest.is_template:
-            assert isinstance(self.dest.format, jinja2.Template)  # noqa: S101  # 👈 for static analysis
-            action(self.dest.format.render(data))
+    def _do(self, action: ActionType, content: str) -> None:
+        if self._passthrough:
+            action(content)
         else:
-            fmt: FormatT = self.dest.format  # type: ignore[assignment]
-            action(dumps(fmt, data))
+            action(self.dest.render(loads(self.src_format, content)))
+
+    def _write(self, content: str) -> None:
+        """Write `content` to the destination file, unless it is unchanged since the last write."""
+        encoded = content.encode('utf-8')
+        digest = hashlib.blake2b(encoded).digest()
+        if digest == self._last_digest:
+            logger.debug("Skip writing unchanged content to '%s'", self.dest.path)
+            return
+
+        self.dest.path.write_bytes(encoded)
+        self._last_digest = digest
 
     def get(self, do_print: typing.Callable[[str], typing.Any]) -> None:
         """Retrieve and print the value of the configuration object."""
-        data = loads(self.src_format, self.backend.get())
-        self._do(do_print, data)
+        self._do(do_print, self.backend.get())
 
     async def aget(self, do_print: typing.Callable[[str], typing.Any]) -> None:
         """Poll to retrieve the latest configuration object, and print on each update."""
@@ -170,13 +219,11 @@ class BackendController:
             systemd.notify()
 
         async for content in self.backend.poll():
-            data = loads(self.src_format, content)
-            self._do(do_print, data)
+            self._do(do_print, content)
 
     def write(self) -> None:
         """Retrieve the latest value of the configuration object, and write to file."""
-        data = loads(self.src_format, self.backend.get())
-        self._do(self.dest.path.write_text, data)
+        self._do(self._write, self.backend.get())
 
     async def awrite(self) -> None:
         """Poll to retrieve the latest configuration object, and write to file on each update."""
@@ -184,8 +231,7 @@ class BackendController:
             systemd.notify()
 
         async for content in self.backend.poll():
-            data = loads(self.src_format, content)
-            self._do(self.dest.path.write_text, data)
+            self._do(self._write, content)
 
 
 logger.debug('successfully imported %s', __name__)
@@ -44,10 +44,10 @@ import typing
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import jinja2
 import sdnotify
 
 if TYPE_CHECKING:  # pragma: no cover
+    import jinja2
     import sh
 else:
     try:
@@ -147,6 +147,8 @@ class Service:
 
     def __init__(self, provider: str, template: str, user_mode: bool) -> None:
         """Prepare to render the specified `template` from the `provider` package."""
+        import jinja2  # pylint: disable=import-outside-toplevel  # defer the import cost until needed
+
         loader = jinja2.PackageLoader(provider)
         env = jinja2.Environment(autoescape=jinja2.select_autoescape(default=True), loader=loader)
         self.tmpl = env.get_template(template)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import json
 from pathlib import Path
 from typing import Any, Iterator, TypeVar
@@ -20,6 +21,7 @@ from mypy_boto3_appconfigdata.type_defs import GetLatestConfigurationResponseTyp
 from pytest_mock import MockerFixture
 
 from config_ninja import cli, systemd
+from config_ninja.contrib import appconfig
 
 # pylint: disable=redefined-outer-name
 
@@ -54,6 +56,13 @@ def mock_file(mock_bytes: bytes) -> MockFile:
     return mock_file
 
 
+def _clear_appconfig_caches() -> None:
+    """Clear the caches in `config_ninja.contrib.appconfig` so tests don't reuse each other's mocks."""
+    # pylint: disable=protected-access
+    appconfig.AppConfigBackend._get_id_from_name.cache_clear()  # pyright: ignore[reportPrivateUsage,reportFunctionMemberAccess]
+    appconfig._get_paginator.cache_clear()  # pyright: ignore[reportPrivateUsage]
+
+
 @pytest.fixture
 def _mock_contextlib_closing(mocker: MockerFixture) -> None:  # pyright: ignore[reportUnusedFunction]
     """Mock `contextlib.closing`."""
@@ -96,12 +105,14 @@ def mock_session(mocker: MockerFixture) -> Session:
     """Mock the `boto3.Session` class."""
     mock_session = mock.MagicMock(name='mock_session', spec_set=Session)
     mocker.patch('boto3.Session', return_value=mock_session)
+    appconfig._session.cache_clear()  # pyright: ignore[reportPrivateUsage]  # don't reuse another test's session
     return mock_session
 
 
 @pytest.fixture
 def mock_session_with_0_ids(mock_appconfig_client: mock.MagicMock, mock_session: mock.MagicMock) -> AppConfigClient:
     """Mock the `boto3` client for the `AppConfig` service to return no IDs."""
+    _clear_appconfig_caches()
     mock_page_iterator = mock.MagicMock(spec_set=PageIterator)
     mock_page_iterator.search.return_value = []
 
@@ -116,6 +127,7 @@ def mock_session_with_0_ids(mock_appconfig_client: mock.MagicMock, mock_session:
 @pytest.fixture
 def mock_session_with_1_id(mock_appconfig_client: mock.MagicMock, mock_session: mock.MagicMock) -> AppConfigClient:
     """Mock the `boto3` client for the `AppConfig` service to return a single ID."""
+    _clear_appconfig_caches()
     mock_page_iterator = mock.MagicMock(name='mock_page_iterator', spec_set=PageIterator)
     mock_page_iterator.search.return_value = ['id-1']
 
@@ -131,6 +143,7 @@ def mock_session_with_1_id(mock_appconfig_client: mock.MagicMock, mock_session:
 @pytest.fixture
 def mock_session_with_2_ids(mock_appconfig_client: mock.MagicMock, mock_session: mock.MagicMock) -> AppConfigClient:
     """Mock the `boto3` client for the `AppConfig` service to return two IDs."""
+    _clear_appconfig_caches()
     mock_page_iterator = mock.MagicMock(spec_set=PageIterator)
     mock_page_iterator.search.return_value = ['id-1', 'id-2']
 
@@ -262,6 +275,25 @@ def mock_poll_too_early(
     return mock_client
 
 
+@pytest.fixture
+def mock_poll_too_early_repeatedly(
+    mock_latest_config: GetLatestConfigurationResponseTypeDef,
+) -> AppConfigDataClient:
+    """Reject five polls as 'Request too early', succeed, reject once more, and then succeed indefinitely."""
+    mock_client = mock.MagicMock(spec_set=AppConfigDataClient)
+    mock_client.exceptions.BadRequestException = ClientError
+    too_early = ClientError(
+        {'Error': {'Code': 'BadRequestException', 'Message': 'Request too early'}, 'ResponseMetadata': {}},
+        'GetLatestConfiguration',
+    )
+
+    mock_client.get_latest_configuration.side_effect = itertools.chain(
+        [too_early] * 5, [mock_latest_config, too_early], itertools.repeat(mock_latest_config)
+    )
+
+    return mock_client
+
+
 @pytest.fixture
 def monkeypatch_systemd(mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> tuple[Path, Path]:
     """Monkeypatch various utilities for interfacing with `systemd` and the shell.
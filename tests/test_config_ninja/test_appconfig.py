@@ -0,0 +1,86 @@
+"""Execute tests for `config_ninja.contrib.appconfig`."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Iterator
+from unittest import mock
+
+import pytest
+from mypy_boto3_appconfigdata import AppConfigDataClient
+from pytest_mock import MockerFixture
+
+from config_ninja.contrib.appconfig import AppConfigBackend
+
+# pylint: disable=redefined-outer-name
+
+
+async def _poll_twice(backend: AppConfigBackend, interval: int) -> None:
+    poller = backend.poll(interval=interval)
+    for _ in range(2):
+        await poller.__anext__()
+    await poller.aclose()
+
+
+def test_poll_backoff(mock_poll_too_early_repeatedly: AppConfigDataClient, mocker: MockerFixture) -> None:
+    """Verify the retry delay doubles up to `interval * 4`, and resets after a successful poll."""
+    # Arrange
+    mock_sleep = mocker.patch('asyncio.sleep', new_callable=mock.AsyncMock)
+    mock_uniform = mocker.patch('random.uniform', return_value=0)
+    backend = AppConfigBackend(mock_poll_too_early_repeatedly, 'app-id', 'conf-id', 'env-id')
+    interval = 10
+
+    # Act
+    asyncio.run(_poll_twice(backend, interval))
+
+    # Assert
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert [5, 10, 20, 40, 40, 1, 5] == delays
+    assert mock.call(0, 0.5) == mock_uniform.call_args_list[0]
+    assert mock.call(0, 4.0) == mock_uniform.call_args_list[4]
+
+
+@pytest.mark.usefixtures('mock_session_with_1_id')
+def test_get_id_from_name_cached(mock_appconfig_client: mock.MagicMock) -> None:
+    """Verify repeated lookups of the same name with the same client only paginate once."""
+    # Act
+    ids = [AppConfigBackend.get_application_id('app-name', mock_appconfig_client) for _ in range(2)]
+
+    # Assert
+    assert ['id-1', 'id-1'] == ids
+    mock_appconfig_client.get_paginator.return_value.paginate.assert_called_once()
+
+
+@pytest.mark.usefixtures('mock_session_with_1_id')
+def test_get_paginator_cached(mock_appconfig_client: mock.MagicMock) -> None:
+    """Verify lookups of different names with the same client share one paginator."""
+    # Arrange
+    names = ['app-name-0', 'app-name-1']
+
+    # Act
+    for name in names:
+        AppConfigBackend.get_application_id(name, mock_appconfig_client)
+
+    # Assert
+    mock_appconfig_client.get_paginator.assert_called_once_with('list_applications')
+    assert len(names) == mock_appconfig_client.get_paginator.return_value.paginate.call_count
+
+
+@pytest.mark.usefixtures('mock_session_with_2_ids')
+def test_get_id_from_name_stops_after_second_match(mock_appconfig_client: mock.MagicMock) -> None:
+    """Verify the search results (and therefore the pages behind them) are not read past the second match."""
+
+    # Arrange
+    def search(*_: str) -> Iterator[str]:
+        yield 'id-1'
+        yield 'id-2'
+        raise AssertionError('the search results were read past the second match')
+
+    mock_appconfig_client.get_paginator.return_value.paginate.return_value.search.side_effect = search
+
+    # Act
+    with pytest.warns(RuntimeWarning, match='found multiple results'):
+        app_id = AppConfigBackend.get_application_id('app-name', mock_appconfig_client)
+
+    # Assert
+    assert 'id-1' == app_id
@@ -18,7 +18,7 @@ from pytest_mock import MockerFixture
 from typer.testing import CliRunner
 
 import config_ninja
-from config_ninja import cli, systemd
+from config_ninja import backend, cli, systemd
 from config_ninja.cli import app
 from tests.fixtures import MOCK_YAML_CONFIG
 
@@ -103,6 +103,25 @@ def test_get_example_appconfig() -> None:
     assert MOCK_YAML_CONFIG.decode('utf-8') in result.stdout.strip()
 
 
+@pytest.mark.usefixtures('mock_full_session')
+def test_apply_example_appconfig_raw(mocker: MockerFixture, settings: dict[str, Any]) -> None:
+    """Verify raw content is written as-is, without being deserialized or serialized."""
+    # Arrange
+    mock_loads = mocker.patch('config_ninja.controller.loads')
+    mock_dump_raw = mocker.MagicMock()
+    mocker.patch.dict(backend.DUMPERS, {'raw': mock_dump_raw})
+    path = Path(settings['CONFIG_NINJA_OBJECTS']['example-appconfig']['dest']['path'])
+
+    # Act
+    result = runner.invoke(app, ['apply', 'example-appconfig'])
+
+    # Assert
+    assert 0 == result.exit_code, result.stdout
+    mock_loads.assert_not_called()
+    mock_dump_raw.assert_not_called()
+    assert MOCK_YAML_CONFIG == path.read_bytes()
+
+
 def test_get_example_local(settings: dict[str, Any]) -> None:
     """Get the 'example-local' configuration (as specified in config-ninja-settings.yaml)."""
     result = runner.invoke(app, ['get', 'example-local'])
@@ -138,6 +157,37 @@ def test_self_print() -> None:
     assert 'example-appconfig' in result.stdout.strip()
 
 
+def test_self_print_no_objects(tmp_path: Path) -> None:
+    """Verify `self print` exits cleanly when the settings file does not define any objects."""
+    # Arrange
+    settings_file = tmp_path / 'config-ninja-settings.yaml'
+    settings_file.write_text('CONFIG_NINJA_OTHER: value\n', encoding='utf-8')
+
+    # Act
+    result = runner.invoke(app, ['--config', str(settings_file), 'self', 'print'])
+
+    # Assert
+    assert 1 == result.exit_code, result.stdout
+    assert isinstance(result.exception, SystemExit)
+
+
+def test_self_print_tty(mocker: MockerFixture, settings: dict[str, Any]) -> None:
+    """Verify `self print` formats the YAML with `rich` when stdout is a terminal."""
+    # Arrange
+    mock_sys = mocker.patch.object(cli, 'sys')  # `CliRunner` replaces `sys.stdout` while invoking the command
+    mock_sys.stdout.isatty.return_value = True
+    mock_print = mocker.patch('rich.print')
+
+    # Act
+    result = runner.invoke(app, ['self', 'print'])
+
+    # Assert
+    assert 0 == result.exit_code, result.stdout
+    mock_print.assert_called_once()
+    mock_sys.stdout.write.assert_not_called()
+    assert settings['CONFIG_NINJA_OBJECTS'] == yaml.safe_load(mock_print.call_args.args[0])
+
+
 def test_apply_example_local(settings: dict[str, Any]) -> None:
     """Execute the `apply` command for a local file backend."""
     result = runner.invoke(app, ['apply', 'example-local'])
@@ -208,6 +258,21 @@ def test_apply_example_local_poll(settings: dict[str, Any]) -> None:
     )
 
 
+@pytest.mark.usefixtures('_patch_awatch')
+@pytest.mark.usefixtures('monkeypatch_systemd')
+def test_apply_example_local_poll_unchanged(mocker: MockerFixture) -> None:
+    """Verify the `apply --poll` command does not rewrite the file when the content is unchanged."""
+    # Arrange
+    spy_write = mocker.spy(Path, 'write_bytes')
+
+    # Act
+    result = runner.invoke(app, ['apply', '--poll', 'example-local'])
+
+    # Assert
+    assert 0 == result.exit_code, result.stdout
+    spy_write.assert_called_once()
+
+
 @pytest.mark.usefixtures('_patch_awatch')
 @pytest.mark.usefixtures('monkeypatch_systemd')
 def test_apply_example_local_template_poll(settings: dict[str, Any]) -> None:
@@ -290,6 +355,25 @@ def test_monitor_local(settings: dict[str, Any]) -> None:
     )
 
 
+@pytest.mark.usefixtures('_patch_awatch')
+@pytest.mark.usefixtures('monkeypatch_systemd')
+def test_monitor_local_mkdir_once(mocker: MockerFixture) -> None:
+    """Verify `monitor` creates a directory shared by multiple destinations only once."""
+    # Arrange
+    local_settings = pyspry.Settings.load('examples/local-backend.yaml', 'CONFIG_NINJA')
+    (parent,) = {Path(obj['dest']['path']).parent for obj in local_settings.OBJECTS.values()}  # all share one dir
+    spy_mkdir = mocker.spy(Path, 'mkdir')
+
+    # Act
+    result = runner.invoke(app, ['--config', 'examples/local-backend.yaml', 'monitor'])
+
+    # Assert
+    assert 0 == result.exit_code, result.stdout
+    # note: `Path.mkdir(parents=True)` recurses into itself when the directory's parents are missing
+    expected_call = mock.call(parent, parents=True, exist_ok=True)
+    assert [expected_call] == [call for call in spy_mkdir.call_args_list if call == expected_call]
+
+
 def test_install_no_systemd(monkeypatch: pytest.MonkeyPatch) -> None:
     """Verify the `install` command fails gracefully when `systemd` is not available."""
     # Arrange